@@ -1,18 +1,10 @@
+from dataclasses import astuple
+
 import streamlit as st
 
-from services.onlyfans import fetch_creator_profile_from_web
-from services.analytics import (
-    generate_synthetic_cohort,
-    percentile_rank,
-    estimate_earnings,
-)
-from services.strategy import (
-    generate_dm_reachout_suggestions,
-    generate_whale_upsell_ideas,
-)
-from services.pricing import run_pricing_engine
-from services.experiments import PricingExperiment, summarize_pricing_experiment
-from services.churn import estimate_monthly_churn, at_risk_heuristics
+# Service modules are imported where they're first used, so a cold start only
+# pays for what the first render actually needs.
+from services.profiles import CreatorProfile
 from ui.layout import (
     render_profile_header,
     render_baseline_card,
@@ -34,20 +26,96 @@ st.title("Silent Partner – Creator Revenue Co‑pilot (MVP)")
 # -----------------------------
 if "web_profile" not in st.session_state:
     st.session_state.web_profile = None
-if "cohort_df" not in st.session_state:
-    st.session_state.cohort_df = None
+if "cohort" not in st.session_state:
+    st.session_state.cohort = None
+if "cohort_sorted" not in st.session_state:
+    st.session_state.cohort_sorted = None
 
 # -----------------------------
 # Caching (big performance win)
 # -----------------------------
-@st.cache_data(ttl=60 * 60, show_spinner=False)  # 1 hour
+@st.cache_data(ttl=60 * 60, max_entries=32, show_spinner=False)  # 1 hour
 def cached_profile_lookup(handle: str, platform: str):
+    from services.onlyfans import fetch_creator_profile_from_web
+
     return fetch_creator_profile_from_web(handle, platform)
 
-@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)  # 24 hours
-def cached_synthetic_cohort(followers: int, avg_views: float, engagement: float, cpm: float, n: int = 1000):
+# Persisted to disk so worker restarts don't regenerate cohorts. No TTL: the
+# cohort is seeded from its inputs, and disk-persisted caches ignore TTLs anyway.
+# max_entries only bounds the in-memory layer; pickles on disk are never
+# evicted, so every distinct input combination stays on disk until cleared.
+# The cache key covers only this wrapper's source, so `cohort_version`
+# (services.analytics.COHORT_VERSION) keeps stale cohorts from surviving a
+# change to the generator.
+@st.cache_data(max_entries=64, persist="disk", show_spinner=False)
+def cached_synthetic_cohort(
+    followers: int,
+    avg_views: float,
+    engagement: float,
+    cpm: float,
+    cohort_version: int,
+    n: int = 1000,
+):
+    from services.analytics import generate_synthetic_cohort
+
     return generate_synthetic_cohort(followers, avg_views, engagement, cpm, n=n)
 
+@st.cache_data(ttl=10 * 60, max_entries=128, show_spinner=False)  # 10 minutes
+def _cached_pricing(
+    followers: int,
+    est_subs: int,
+    avg_views: float,
+    er: float,
+    cpm: float,
+    price: float,
+    risk: str,
+):
+    from services.pricing import run_pricing_engine
+
+    return run_pricing_engine(
+        followers=followers,
+        estimated_subscribers=est_subs,
+        avg_views=avg_views,
+        engagement_rate=er,
+        avg_cpm=cpm,
+        current_price=price,
+        risk_profile=risk,
+    )
+
+# Keyed by name so services.experiments stays lazily imported; the frozen
+# dataclass's field tuple is the whole cache key.
+@st.cache_data(max_entries=128, show_spinner=False, hash_funcs={"services.experiments.PricingExperiment": astuple})
+def _cached_experiment_summary(exp):
+    from services.experiments import summarize_pricing_experiment
+
+    return summarize_pricing_experiment(exp)
+
+def _profile_cache_key(profile):
+    # Only these fields feed the strategy generators, so hashing the whole
+    # profile would just cost time and cause needless misses.
+    return (profile.platform, profile.handle, profile.profile_name)
+
+@st.cache_data(ttl=10 * 60, max_entries=128, show_spinner=False, hash_funcs={CreatorProfile: _profile_cache_key})
+def _cached_dm_suggestions(profile, followers: int, est_subs: int, er: float):
+    from services.strategy import generate_dm_reachout_suggestions
+
+    return generate_dm_reachout_suggestions(
+        profile=profile,
+        followers=followers,
+        estimated_subscribers=est_subs,
+        engagement_rate=er,
+    )
+
+@st.cache_data(ttl=10 * 60, max_entries=128, show_spinner=False, hash_funcs={CreatorProfile: _profile_cache_key})
+def _cached_whale_ideas(profile, est_subs: int, cpm: float):
+    from services.strategy import generate_whale_upsell_ideas
+
+    return generate_whale_upsell_ideas(
+        profile=profile,
+        estimated_subscribers=est_subs,
+        avg_cpm=cpm,
+    )
+
 # -----------------------------
 # Sidebar – inputs
 # -----------------------------
@@ -69,11 +137,11 @@ if st.sidebar.button("Lookup from web"):
 st.sidebar.markdown("---")
 st.sidebar.header("Stats (override)")
 
-wp = st.session_state.web_profile or {}
-followers_input = st.sidebar.number_input("Followers / fans", min_value=1, value=int(wp.get("followers", 10_000)), step=100)
-avg_views_input = st.sidebar.number_input("Avg views per post", min_value=1, value=int(wp.get("avg_views", 3_000)), step=100)
-engagement_input = st.sidebar.number_input("Engagement rate (%)", min_value=0.1, max_value=100.0, value=float(wp.get("engagement_rate", 3.5)), step=0.1)
-cpm_input = st.sidebar.number_input("Avg CPM (USD)", min_value=0.5, max_value=1000.0, value=float(wp.get("avg_cpm", 20.0)), step=0.5)
+wp = st.session_state.web_profile or CreatorProfile(followers=10_000, avg_views=3_000, engagement_rate=3.5, avg_cpm=20.0)
+followers_input = st.sidebar.number_input("Followers / fans", min_value=1, value=int(wp.followers), step=100)
+avg_views_input = st.sidebar.number_input("Avg views per post", min_value=1, value=int(wp.avg_views), step=100)
+engagement_input = st.sidebar.number_input("Engagement rate (%)", min_value=0.1, max_value=100.0, value=float(wp.engagement_rate), step=0.1)
+cpm_input = st.sidebar.number_input("Avg CPM (USD)", min_value=0.5, max_value=1000.0, value=float(wp.avg_cpm), step=0.5)
 
 st.sidebar.markdown("---")
 st.sidebar.header("Pricing inputs")
@@ -82,92 +150,115 @@ risk_profile = st.sidebar.selectbox("Risk profile", ["Conservative", "Balanced",
 
 st.sidebar.markdown("---")
 if st.sidebar.button("Generate cohort benchmarks"):
+    from services.analytics import COHORT_VERSION, sort_cohort
+
+    cohort_args = (
+        int(followers_input),
+        float(avg_views_input),
+        float(engagement_input),
+        float(cpm_input),
+        COHORT_VERSION,
+    )
     with st.spinner("Generating synthetic cohort..."):
-        st.session_state.cohort_df = cached_synthetic_cohort(
-            int(followers_input),
-            float(avg_views_input),
-            float(engagement_input),
-            float(cpm_input),
-            n=1000,
-        )
+        cohort = cached_synthetic_cohort(*cohort_args, n=1000)
+    st.session_state.cohort = cohort
+    # Sorting 4x1000 values costs less than a cache lookup, so it isn't cached.
+    st.session_state.cohort_sorted = sort_cohort(cohort)
 
 # -----------------------------
 # Active profile
 # -----------------------------
-active_profile = st.session_state.web_profile or {
-    "platform": platform,
-    "handle": handle or "unknown",
-    "profile_name": handle or "Creator",
-}
-est_subs = int(active_profile.get("estimated_subscribers", followers_input) or followers_input)
-est_visits = active_profile.get("estimated_monthly_visits")
+active_profile = st.session_state.web_profile or CreatorProfile(
+    platform=platform,
+    handle=handle or "unknown",
+    profile_name=handle or "Creator",
+)
+est_subs = int(active_profile.estimated_subscribers or followers_input)
+est_visits = active_profile.estimated_monthly_visits
 
 # -----------------------------
-# Tabs UI (modern, fast navigation)
+# Tab renderers
 # -----------------------------
-tab_overview, tab_pricing, tab_dms, tab_whales, tab_churn = st.tabs(
-    ["Overview", "Pricing & A/B Tests", "DM Playbooks", "Whales", "Churn"]
-)
+# Each tab is a fragment: interacting with a widget inside a tab reruns only
+# that tab instead of the whole script.
+@st.fragment
+def render_overview_tab(
+    profile,
+    followers: int,
+    avg_views: float,
+    engagement: float,
+    cpm: float,
+    est_subs: int,
+    est_visits,
+    current_price: float,
+):
+    from services.analytics import cohort_preview, estimate_earnings, percentile_ranks
 
-with tab_overview:
     st.subheader("Creator overview")
-    render_profile_header(active_profile)
+    render_profile_header(profile)
 
     col_a, col_b = st.columns([2, 1])
     with col_a:
         render_baseline_card(
-            followers=followers_input,
+            followers=followers,
             est_subs=est_subs,
-            current_price=current_sub_price,
+            current_price=current_price,
             est_monthly_visits=est_visits,
         )
 
     with col_b:
         st.markdown("#### Quick earnings calculator")
         monthly_posts = st.number_input("Posts per month", min_value=1, max_value=1000, value=30, key="posts_per_month_overview")
-        total_impressions, est_earnings = estimate_earnings(monthly_posts, avg_views_input, cpm_input)
+        total_impressions, est_earnings = estimate_earnings(monthly_posts, avg_views, cpm)
         st.metric("Monthly impressions", f"{total_impressions:,.0f}")
         st.metric("Est. earnings (USD)", f"${est_earnings:,.2f}")
 
     st.markdown("---")
     st.subheader("Benchmarks vs similar creators")
 
-    df = st.session_state.cohort_df
-    if df is not None and len(df) > 0:
-        p_followers = percentile_rank(df["followers"], followers_input)
-        p_views = percentile_rank(df["avg_views"], avg_views_input)
-        p_eng = percentile_rank(df["engagement_rate"], engagement_input)
-        p_cpm = percentile_rank(df["avg_cpm"], cpm_input)
+    cohort = st.session_state.cohort
+    cohort_sorted = st.session_state.cohort_sorted
+    if cohort is not None and len(cohort["followers"]) > 0 and cohort_sorted is not None:
+        pct = percentile_ranks(
+            cohort_sorted,
+            {
+                "followers": followers,
+                "avg_views": avg_views,
+                "engagement_rate": engagement,
+                "avg_cpm": cpm,
+            },
+        )
 
         st.write(
-            f"- Followers: **{p_followers}th** percentile\n"
-            f"- Avg views: **{p_views}th** percentile\n"
-            f"- Engagement: **{p_eng}th** percentile\n"
-            f"- CPM: **{p_cpm}th** percentile"
+            f"- Followers: **{pct['followers']}th** percentile\n"
+            f"- Avg views: **{pct['avg_views']}th** percentile\n"
+            f"- Engagement: **{pct['engagement_rate']}th** percentile\n"
+            f"- CPM: **{pct['avg_cpm']}th** percentile"
         )
         with st.expander("See sample cohort rows"):
-            st.dataframe(df.head(25))
+            st.dataframe(cohort_preview(cohort, rows=25))
     else:
         st.info("Click **Generate cohort benchmarks** in the sidebar to see percentile positioning.")
 
     with st.expander("Raw profile data (debug)"):
         if st.session_state.web_profile:
-            st.json(st.session_state.web_profile)
+            st.json(st.session_state.web_profile.as_dict())
         else:
             st.write("No web profile loaded yet.")
 
-with tab_pricing:
+@st.fragment
+def render_pricing_tab(
+    followers: int,
+    est_subs: int,
+    avg_views: float,
+    engagement: float,
+    cpm: float,
+    current_price: float,
+    risk: str,
+):
     st.subheader("Pricing engine + recommended test")
 
-    pe = run_pricing_engine(
-        followers=int(followers_input),
-        estimated_subscribers=int(est_subs),
-        avg_views=float(avg_views_input),
-        engagement_rate=float(engagement_input),
-        avg_cpm=float(cpm_input),
-        current_price=float(current_sub_price),
-        risk_profile=risk_profile.lower(),
-    )
+    pe = _cached_pricing(followers, est_subs, avg_views, engagement, cpm, current_price, risk)
 
     m1, m2, m3 = st.columns(3)
     m1.metric("Suggested sub price", f"${pe['suggested_sub_price']:.2f}")
@@ -186,7 +277,7 @@ with tab_pricing:
 
     with st.container(border=True):
         exp_name = st.text_input("Experiment name", value="Pricing Test #1 (new subs)", key="exp_name")
-        c_price = st.number_input("Control price ($)", min_value=1.0, max_value=200.0, value=float(current_sub_price), step=0.5, key="c_price")
+        c_price = st.number_input("Control price ($)", min_value=1.0, max_value=200.0, value=float(current_price), step=0.5, key="c_price")
         t_price = st.number_input("Test price ($)", min_value=1.0, max_value=200.0, value=float(pe["pricing_test"]["test_price"]), step=0.5, key="t_price")
         days = st.number_input("Days running", min_value=1, max_value=90, value=int(pe["pricing_test"]["duration_days"]), key="days_running")
 
@@ -199,6 +290,9 @@ with tab_pricing:
             t_seen = st.number_input("Test exposures (optional)", min_value=0, max_value=100000000, value=0, key="t_seen")
 
         if st.button("Evaluate winner"):
+            # Loaded on first use: most sessions never evaluate an experiment.
+            from services.experiments import PricingExperiment
+
             exp = PricingExperiment(
                 name=exp_name,
                 control_price=c_price,
@@ -209,7 +303,7 @@ with tab_pricing:
                 control_seen=(c_seen or None),
                 test_seen=(t_seen or None),
             )
-            summary = summarize_pricing_experiment(exp)
+            summary = _cached_experiment_summary(exp)
 
             st.success(f"Winner (revenue proxy): {summary['winner'].upper()}")
             st.write(f"Control revenue proxy: **${summary['control_revenue_proxy']:,.2f}**")
@@ -219,23 +313,16 @@ with tab_pricing:
                 st.write(f"Outcome uplift: **{summary['uplift_pct']}%** (metric type: {summary['metric_type']})")
             st.caption(summary["notes"])
 
-with tab_dms:
+@st.fragment
+def render_dm_tab(profile, followers: int, est_subs: int, engagement: float):
     st.subheader("DM playbooks")
-    dm_suggestions = generate_dm_reachout_suggestions(
-        profile=active_profile,
-        followers=int(followers_input),
-        estimated_subscribers=int(est_subs),
-        engagement_rate=float(engagement_input),
-    )
+    dm_suggestions = _cached_dm_suggestions(profile, followers, est_subs, engagement)
     render_dm_suggestions(dm_suggestions)
 
-with tab_whales:
+@st.fragment
+def render_whale_tab(profile, est_subs: int, cpm: float):
     st.subheader("Whale offers + top ways to earn more")
-    whale_ideas = generate_whale_upsell_ideas(
-        profile=active_profile,
-        estimated_subscribers=int(est_subs),
-        avg_cpm=float(cpm_input),
-    )
+    whale_ideas = _cached_whale_ideas(profile, est_subs, cpm)
     render_whale_ideas(whale_ideas)
 
     st.markdown("#### Whale revenue levers (MVP heuristics)")
@@ -245,7 +332,10 @@ with tab_whales:
         st.write("- Limited-seat group show ($50–$150/seat)")
         st.caption("When you add real spend distribution data later, this tab becomes true whale analytics.")
 
-with tab_churn:
+@st.fragment
+def render_churn_tab(profile, followers: int, est_subs: int, engagement: float):
+    from services.churn import estimate_monthly_churn, at_risk_heuristics
+
     st.subheader("Churn signals (MVP)")
     st.caption(
         "Without subscriber-level data, we model churn using manual inputs and heuristics. "
@@ -278,17 +368,51 @@ with tab_churn:
 
     st.markdown("---")
     st.markdown("#### Win-back DM templates (from DM playbooks)")
-    dm_suggestions = generate_dm_reachout_suggestions(
-        profile=active_profile,
-        followers=int(followers_input),
-        estimated_subscribers=int(est_subs),
-        engagement_rate=float(engagement_input),
-    )
+    dm_suggestions = _cached_dm_suggestions(profile, followers, est_subs, engagement)
     # Show just the lapsed/at-risk one prominently
     st.write("Best match: **Lapsed or at-risk subs**")
     st.write(dm_suggestions[-1]["message"])
     st.caption(f"CTA: {dm_suggestions[-1]['cta']} · Timing: {dm_suggestions[-1]['timing']}")
 
+# -----------------------------
+# Tabs UI (modern, fast navigation)
+# -----------------------------
+tab_overview, tab_pricing, tab_dms, tab_whales, tab_churn = st.tabs(
+    ["Overview", "Pricing & A/B Tests", "DM Playbooks", "Whales", "Churn"]
+)
+
+with tab_overview:
+    render_overview_tab(
+        active_profile,
+        followers_input,
+        avg_views_input,
+        engagement_input,
+        cpm_input,
+        est_subs,
+        est_visits,
+        current_sub_price,
+    )
+
+with tab_pricing:
+    render_pricing_tab(
+        int(followers_input),
+        int(est_subs),
+        float(avg_views_input),
+        float(engagement_input),
+        float(cpm_input),
+        float(current_sub_price),
+        risk_profile.lower(),
+    )
+
+with tab_dms:
+    render_dm_tab(active_profile, int(followers_input), int(est_subs), float(engagement_input))
+
+with tab_whales:
+    render_whale_tab(active_profile, int(est_subs), float(cpm_input))
+
+with tab_churn:
+    render_churn_tab(active_profile, int(followers_input), int(est_subs), float(engagement_input))
+
 st.markdown("---")
 st.caption(
     "Note: OnlyFans scraping is based on public meta information and may break if the site changes. "
@@ -1,8 +1,19 @@
-from typing import Tuple
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
+COHORT_COLUMNS = ("followers", "avg_views", "engagement_rate", "avg_cpm")
+
+# Bump whenever generate_synthetic_cohort's output changes (dtypes, RNG draws,
+# distributions). The app passes it into its disk-persisted cohort caches,
+# whose keys don't see this module's code.
+COHORT_VERSION = 1
+
+# Largest float32 that still fits in int32 (2**31 - 128); caps sampled counts
+# so the int32 cast below can't overflow for mega-accounts.
+_INT32_SAFE_MAX = 2_147_483_520.0
+
 
 def generate_synthetic_cohort(
     followers: int,
@@ -10,52 +21,100 @@ def generate_synthetic_cohort(
     engagement_rate: float,
     avg_cpm: float,
     n: int = 1000,
-) -> pd.DataFrame:
+    rng: Optional[np.random.Generator] = None,
+) -> Dict[str, np.ndarray]:
     """
     Generate a synthetic cohort of similar creators to benchmark against.
     Very simple probabilistic model around the given stats.
+
+    Returns one contiguous array per column in COHORT_COLUMNS (int32 counts,
+    float32 rates); use `cohort_preview` when a DataFrame is needed for display.
+
+    Unless an explicit `rng` is passed, a fresh Generator is seeded from the
+    inputs, so the same stats always produce the same cohort (which keeps
+    cached results stable) and no RNG state is shared between calls.
     """
 
     followers = max(followers, 1)
     base_log = np.log(followers)
 
+    if rng is None:
+        seed = hash((followers, avg_views, engagement_rate, avg_cpm, n)) & 0xFFFFFFFF
+        rng = np.random.default_rng(seed)
+
+    # One float32 row of standard normals per column, drawn in a single RNG
+    # call; every transform below happens in place on its row.
+    buf = rng.standard_normal((4, n), dtype=np.float32)
+    followers_dist, views_dist, er_dist, cpm_dist = buf
+
     # Followers: log-normal spread around the creator's follower count
-    followers_dist = np.random.lognormal(mean=base_log, sigma=0.4, size=n).astype(int)
+    followers_dist *= 0.4
+    followers_dist += base_log
+    np.exp(followers_dist, out=followers_dist)
+    np.minimum(followers_dist, _INT32_SAFE_MAX, out=followers_dist)
+    np.floor(followers_dist, out=followers_dist)
 
     # Views: normally 20–50% of followers, centered around creator's ratio
     creator_view_ratio = avg_views / followers if followers > 0 else 0.3
     creator_view_ratio = np.clip(creator_view_ratio, 0.05, 0.8)
-    view_ratios = np.random.normal(loc=creator_view_ratio, scale=0.05, size=n)
-    view_ratios = np.clip(view_ratios, 0.02, 0.9)
-    views_dist = (followers_dist * view_ratios).astype(int)
+    views_dist *= 0.05
+    views_dist += creator_view_ratio
+    np.clip(views_dist, 0.02, 0.9, out=views_dist)
+    views_dist *= followers_dist
 
     # Engagement rate: normal around creator's ER ± 1.5pp
     er_mean = np.clip(engagement_rate, 0.1, 50.0)
-    er_dist = np.random.normal(loc=er_mean, scale=1.5, size=n)
-    er_dist = np.clip(er_dist, 0.1, 80.0)
+    er_dist *= 1.5
+    er_dist += er_mean
+    np.clip(er_dist, 0.1, 80.0, out=er_dist)
 
     # CPM: log-normal around creator's CPM
     cpm_base = max(avg_cpm, 0.5)
     log_cpm_mean = np.log(cpm_base)
-    cpm_dist = np.random.lognormal(mean=log_cpm_mean, sigma=0.35, size=n)
+    cpm_dist *= 0.35
+    cpm_dist += log_cpm_mean
+    np.exp(cpm_dist, out=cpm_dist)
+
+    # Counts become int32 (truncating, like the old astype(int)); rates stay float32.
+    return {
+        "followers": followers_dist.astype(np.int32),
+        "avg_views": views_dist.astype(np.int32),
+        "engagement_rate": er_dist,
+        "avg_cpm": cpm_dist,
+    }
 
-    df = pd.DataFrame(
-        {
-            "followers": followers_dist,
-            "avg_views": views_dist,
-            "engagement_rate": er_dist,
-            "avg_cpm": cpm_dist,
-        }
-    )
 
-    return df
+def cohort_preview(cohort: Dict[str, np.ndarray], rows: int = 25) -> pd.DataFrame:
+    """Build a small DataFrame from the first `rows` cohort rows for display."""
+    return pd.DataFrame({col: values[:rows] for col, values in cohort.items()})
 
 
-def percentile_rank(series: pd.Series, value: float) -> float:
-    """Return the percentile rank of `value` within `series`."""
-    if len(series) == 0:
+def sort_cohort(cohort: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Sort each benchmark column of the cohort once so percentile lookups
+    can binary-search instead of scanning the whole column.
+    """
+    return {col: np.sort(cohort[col]) for col in COHORT_COLUMNS}
+
+
+def percentile_rank(sorted_values: np.ndarray, value: float) -> float:
+    """Return the percentile rank of `value` within the pre-sorted `sorted_values`."""
+    n = len(sorted_values)
+    if n == 0:
         return 0.0
-    return round(100.0 * (series < value).mean(), 2)
+    return round(100.0 * np.searchsorted(sorted_values, value, side="left") / n, 2)
+
+
+def percentile_ranks(
+    sorted_cols: Dict[str, np.ndarray],
+    values: Dict[str, float],
+) -> Dict[str, float]:
+    """
+    Percentile rank of several values at once, e.g.
+    {"followers": 12000, "avg_cpm": 18.5} -> {"followers": 61.3, "avg_cpm": 44.0}.
+    `sorted_cols` is the output of `sort_cohort`.
+    """
+    return {col: percentile_rank(sorted_cols[col], value) for col, value in values.items()}
 
 
 def estimate_earnings(
@@ -1,4 +1,15 @@
-from typing import Dict, Any
+from bisect import bisect_right
+from typing import TYPE_CHECKING, Dict, Any
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Band upper bounds are exclusive: churn < 5% is healthy, 5% <= churn < 10% is watch, ...
+_CHURN_THRESH = (0.05, 0.10)
+_CHURN_LABEL = ("healthy", "watch", "risk")
+
+_RISK_THRESH = (5, 15)
+_RISK_LABEL = ("low", "medium", "high")
 
 
 def estimate_monthly_churn(active_subs: int, cancels_30d: int) -> Dict[str, Any]:
@@ -14,11 +25,30 @@ def estimate_monthly_churn(active_subs: int, cancels_30d: int) -> Dict[str, Any]
         "active_subs": active_subs,
         "cancels_30d": cancels_30d,
         "monthly_churn_rate_pct": round(churn_rate * 100.0, 2),
-        "health_label": (
-            "healthy" if churn_rate < 0.05 else
-            "watch" if churn_rate < 0.10 else
-            "risk"
-        )
+        "health_label": _CHURN_LABEL[bisect_right(_CHURN_THRESH, churn_rate)],
+    }
+
+
+def estimate_monthly_churn_batch(
+    active_subs: "np.ndarray",
+    cancels_30d: "np.ndarray",
+) -> Dict[str, "np.ndarray"]:
+    """
+    Vectorised `estimate_monthly_churn` for scoring many creators/cohorts at
+    once. Takes equal-length integer arrays and returns one array per field.
+    """
+    # Only the batch paths need NumPy; keep it off the scalar path's import.
+    import numpy as np
+
+    active_subs = np.maximum(np.asarray(active_subs, dtype=np.int64), 1)
+    cancels_30d = np.maximum(np.asarray(cancels_30d, dtype=np.int64), 0)
+
+    churn_rate = cancels_30d / active_subs
+    return {
+        "active_subs": active_subs,
+        "cancels_30d": cancels_30d,
+        "monthly_churn_rate_pct": np.round(churn_rate * 100.0, 2),
+        "health_label": np.asarray(_CHURN_LABEL)[np.searchsorted(_CHURN_THRESH, churn_rate, side="right")],
     }
 
 
@@ -30,7 +60,7 @@ def at_risk_heuristics(payment_fails: int, inactive_14d: int) -> Dict[str, Any]:
     inactive_14d = max(int(inactive_14d), 0)
 
     risk_score = payment_fails * 2 + inactive_14d * 1
-    band = "low" if risk_score < 5 else "medium" if risk_score < 15 else "high"
+    band = _RISK_LABEL[bisect_right(_RISK_THRESH, risk_score)]
 
     return {
         "payment_fails": payment_fails,
@@ -43,3 +73,26 @@ def at_risk_heuristics(payment_fails: int, inactive_14d: int) -> Dict[str, Any]:
             "Post a high-performing content type within 24–48h to re-activate lurkers",
         ],
     }
+
+
+def at_risk_heuristics_batch(
+    payment_fails: "np.ndarray",
+    inactive_14d: "np.ndarray",
+) -> Dict[str, "np.ndarray"]:
+    """
+    Vectorised `at_risk_heuristics` scoring for a whole subscriber table.
+    Returns per-row arrays for the numeric fields and the risk band; the
+    recommended actions are per-creator copy and stay in the scalar version.
+    """
+    import numpy as np
+
+    payment_fails = np.maximum(np.asarray(payment_fails, dtype=np.int32), 0)
+    inactive_14d = np.maximum(np.asarray(inactive_14d, dtype=np.int32), 0)
+
+    risk_score = np.add(np.multiply(payment_fails, 2, dtype=np.int32), inactive_14d)
+    return {
+        "payment_fails": payment_fails,
+        "inactive_14d": inactive_14d,
+        "risk_score": risk_score,
+        "risk_band": np.asarray(_RISK_LABEL)[np.searchsorted(_RISK_THRESH, risk_score, side="right")],
+    }
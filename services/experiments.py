@@ -1,8 +1,11 @@
 from dataclasses import dataclass, asdict
-from typing import Dict, Any, Optional
+from math import isnan
+from typing import Dict, Any, Optional, Tuple
 
+_NAN = float("nan")
 
-@dataclass
+
+@dataclass(frozen=True)
 class PricingExperiment:
     name: str
     control_price: float
@@ -14,6 +17,43 @@ class PricingExperiment:
     test_seen: Optional[int] = None
 
 
+def _summarize_core(
+    c_subs: int,
+    t_subs: int,
+    c_seen: int,
+    t_seen: int,
+    c_price: float,
+    t_price: float,
+) -> Tuple[float, float, float, float, float, float, int]:
+    """
+    Numeric kernel of the A/B evaluator: plain ints/floats in and out, so it
+    can be batched or JIT-compiled later. Undefined values are NaN
+    (a -1.0 sentinel would collide with a real -1% uplift), and exposures
+    of 0 mean "unknown".
+
+    Returns (c_rate, t_rate, uplift, control_rev, test_rev, rev_uplift, test_wins).
+    """
+    # If exposures known, compute conversion rates; else treat new subs as outcome proxy.
+    if c_seen > 0 and t_seen > 0:
+        c_rate = c_subs / c_seen
+        t_rate = t_subs / t_seen
+        uplift = (t_rate / c_rate - 1.0) * 100.0 if c_rate > 0 else _NAN
+    else:
+        c_rate = _NAN
+        t_rate = _NAN
+        uplift = (t_subs / c_subs - 1.0) * 100.0 if c_subs > 0 else _NAN
+
+    # Revenue proxy from subscriptions only (no churn modeling here)
+    control_rev = c_subs * c_price
+    test_rev = t_subs * t_price
+    rev_uplift = (test_rev / control_rev - 1.0) * 100.0 if control_rev > 0 else _NAN
+
+    # NaN compares False, so an undefined uplift falls back to "control".
+    test_wins = 1 if rev_uplift > 0 else 0
+
+    return c_rate, t_rate, uplift, control_rev, test_rev, rev_uplift, test_wins
+
+
 def summarize_pricing_experiment(exp: PricingExperiment) -> Dict[str, Any]:
     """
     Heuristic summary for an A/B price test when we only have new subs counts.
@@ -22,34 +62,27 @@ def summarize_pricing_experiment(exp: PricingExperiment) -> Dict[str, Any]:
     c_subs = max(int(exp.control_new_subs), 0)
     t_subs = max(int(exp.test_new_subs), 0)
 
-    # If exposures known, compute conversion rates; else treat new subs as outcome proxy.
-    if exp.control_seen and exp.test_seen and exp.control_seen > 0 and exp.test_seen > 0:
-        c_rate = c_subs / exp.control_seen
-        t_rate = t_subs / exp.test_seen
-        uplift = (t_rate / c_rate - 1.0) * 100.0 if c_rate > 0 else None
-        metric_type = "conversion_rate"
-    else:
-        c_rate = None
-        t_rate = None
-        uplift = (t_subs / c_subs - 1.0) * 100.0 if c_subs > 0 else None
-        metric_type = "new_subs_proxy"
-
-    # Revenue proxy from subscriptions only (no churn modeling here)
-    control_rev = c_subs * float(exp.control_price)
-    test_rev = t_subs * float(exp.test_price)
-    rev_uplift = (test_rev / control_rev - 1.0) * 100.0 if control_rev > 0 else None
-
-    winner = "test" if (rev_uplift is not None and rev_uplift > 0) else "control"
+    c_rate, t_rate, uplift, control_rev, test_rev, rev_uplift, test_wins = _summarize_core(
+        c_subs,
+        t_subs,
+        int(exp.control_seen or 0),
+        int(exp.test_seen or 0),
+        float(exp.control_price),
+        float(exp.test_price),
+    )
+    has_rates = not isnan(c_rate)
+    metric_type = "conversion_rate" if has_rates else "new_subs_proxy"
+    winner = "test" if test_wins else "control"
 
     return {
         "experiment": asdict(exp),
         "metric_type": metric_type,
-        "control_conversion_rate": c_rate,
-        "test_conversion_rate": t_rate,
-        "uplift_pct": round(uplift, 2) if uplift is not None else None,
+        "control_conversion_rate": c_rate if has_rates else None,
+        "test_conversion_rate": t_rate if has_rates else None,
+        "uplift_pct": None if isnan(uplift) else round(uplift, 2),
         "control_revenue_proxy": round(control_rev, 2),
         "test_revenue_proxy": round(test_rev, 2),
-        "revenue_uplift_pct": round(rev_uplift, 2) if rev_uplift is not None else None,
+        "revenue_uplift_pct": None if isnan(rev_uplift) else round(rev_uplift, 2),
         "winner": winner,
         "notes": (
             "This is a simplified A/B evaluator. For real pricing optimization you’d want "
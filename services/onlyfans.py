@@ -1,8 +1,70 @@
 import re
-from typing import Dict, Any, Optional
-
-import requests
-from bs4 import BeautifulSoup
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from functools import partial
+from html import unescape
+from typing import TYPE_CHECKING, Callable, Dict, Any, List, Optional, Tuple
+
+from services.profiles import CreatorProfile
+
+# requests, selectolax and bs4 are imported where they're used, so importing
+# this module (e.g. to build a fallback profile) doesn't pay for them.
+if TYPE_CHECKING:
+    import requests
+
+# Suffix multipliers for human-readable counts ("4.5k", "10.2m").
+_MULT = {"k": 1_000.0, "m": 1_000_000.0, "b": 1_000_000_000.0}
+# Lowercases ASCII and drops thousands separators in a single pass.
+_NORM_TABLE = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz", ",")
+
+# All profile stats in one pattern, compiled once and scanned once per string.
+_RE_STATS = re.compile(
+    r"(?P<num>\d[\d.,]*\s*[kKmM]?)\s+"
+    r"(?P<kind>[Ll]ikes|[Ff]ans|[Ff]ollowers?|[Pp]osts?|[Pp]hotos?|[Vv]ideos?)"
+)
+_RE_HEAD_END = re.compile(r"</head\s*>", re.IGNORECASE)
+
+# The handful of <head> tags we read, matched straight off the raw HTML so the
+# common case never builds a DOM. Each <meta> tag is matched whole, then its
+# key and content are picked out separately, so attribute order and extra
+# attributes (e.g. Nuxt's data-hid) don't matter. The tag pattern skips over
+# quoted values, so a ">" inside content="Hi -> 4.5K fans" doesn't end the tag;
+# values may use either quote style. The lookbehinds keep "data-name=" from
+# passing for "name=".
+_RE_META = re.compile(r"""<meta\b(?:[^>"']|"[^"]*"|'[^']*')*>""", re.IGNORECASE)
+_RE_META_KEY = re.compile(r"""(?<![-\w])(?:property|name)\s*=\s*(["'])(.+?)\1""", re.IGNORECASE | re.DOTALL)
+_RE_META_CONTENT = re.compile(r"""(?<![-\w])content\s*=\s*(["'])(.*?)\1""", re.IGNORECASE | re.DOTALL)
+_RE_TITLE = re.compile(r"<title[^>]*>(.*?)</title\s*>", re.IGNORECASE | re.DOTALL)
+
+# Singular, lowercased stat word -> profile field it fills.
+_STAT_FIELDS = {
+    "like": "likes",
+    "fan": "followers",
+    "follower": "followers",
+    "post": "posts_count",
+    "photo": "photos_count",
+    "video": "videos_count",
+}
+
+# Parsed profiles, keyed by username: {username: (fetched_at, profile)}.
+# Repeat lookups within the TTL skip the network, the HTML parse and the
+# regex scans. Fetch errors are never cached.
+_PROFILE_CACHE_TTL = 15 * 60  # seconds
+_PROFILE_CACHE_MAX = 256
+_profile_cache: Dict[str, Tuple[float, CreatorProfile]] = {}
+# Streamlit session threads and fetch_many_onlyfans_profiles' pool share the cache.
+_profile_cache_lock = threading.Lock()
+
+# Shared keep-alive session: repeat scrapes reuse pooled connections instead
+# of paying a fresh TCP + TLS handshake per request. Built on first fetch.
+_session: Optional["requests.Session"] = None
+_session_lock = threading.Lock()
+
+# Everything we read (og:*, description, title, the stat counters) sits near
+# the top of the page, so stop downloading/decoding past this many bytes.
+_MAX_HTML_BYTES = 256 * 1024
 
 
 def _parse_human_number(text: str) -> Optional[int]:
@@ -12,206 +74,317 @@ def _parse_human_number(text: str) -> Optional[int]:
     """
     if not text:
         return None
-    t = text.strip().lower().replace(",", "")
-    match = re.match(r"^([0-9]*\.?[0-9]+)\s*([km])?$", t)
-    if not match:
-        if t.isdigit():
-            return int(t)
+    t = text.translate(_NORM_TABLE).strip()
+    if not t:
+        return None
+    mult = _MULT.get(t[-1])
+    if mult is not None:
+        t = t[:-1]
+    try:
+        return int(float(t) * (mult or 1.0))
+    except (ValueError, OverflowError):
+        # OverflowError: float() accepts "inf"
         return None
 
-    num = float(match.group(1))
-    suffix = match.group(2)
 
-    if suffix == "k":
-        num *= 1_000
-    elif suffix == "m":
-        num *= 1_000_000
+def _scan_stats(text: str, stats: Dict[str, Optional[int]]) -> None:
+    """
+    Single pass over `text` filling any stats in `stats` that are still None.
+    The first parseable number for each stat wins, and the scan stops as soon
+    as every stat is filled rather than walking the rest of a long page.
+    """
+    missing = sum(value is None for value in stats.values())
+    if not missing:
+        return
+    for match in _RE_STATS.finditer(text):
+        field = _STAT_FIELDS[match.group("kind").lower().rstrip("s")]
+        if stats[field] is None:
+            stats[field] = _parse_human_number(match.group("num"))
+            if stats[field] is not None:
+                missing -= 1
+                if not missing:
+                    return
+
+
+def _cache_get(username: str) -> Optional[CreatorProfile]:
+    with _profile_cache_lock:
+        hit = _profile_cache.get(username)
+    if hit is None or time.monotonic() - hit[0] >= _PROFILE_CACHE_TTL:
+        return None
+    # Profiles are frozen, so the cached instance can be shared as-is.
+    return hit[1]
+
+
+def _cache_put(username: str, profile: CreatorProfile) -> None:
+    with _profile_cache_lock:
+        _profile_cache.pop(username, None)
+        if len(_profile_cache) >= _PROFILE_CACHE_MAX:
+            # Dicts keep insertion order, so the first key is the oldest entry.
+            _profile_cache.pop(next(iter(_profile_cache)), None)
+        _profile_cache[username] = (time.monotonic(), profile)
+
+
+def _get_session() -> "requests.Session":
+    """Return the shared session, creating it on first use (thread-safe)."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                session.headers.update(
+                    {
+                        "User-Agent": (
+                            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                            "AppleWebKit/537.36 (KHTML, like Gecko) "
+                            "Chrome/120.0 Safari/537.36"
+                        ),
+                        "Accept-Language": "en-US,en;q=0.9",
+                    }
+                )
+                # Pool size covers fetch_many_onlyfans_profiles' concurrency.
+                session.mount(
+                    "https://", HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=2)
+                )
+                _session = session
+    return _session
+
+
+def _fetch_html(url: str) -> str:
+    """
+    GET `url` and return at most the first `_MAX_HTML_BYTES` of its body,
+    decoded. Raises on network/HTTP errors.
+
+    Trade-off: a body that fits under the cap is read to the end, so its
+    connection goes back to the session pool. A larger one is cut short, and
+    closing a partly read response makes urllib3 discard that socket, so
+    the next fetch pays a fresh TCP + TLS handshake. Draining the rest just
+    to keep the socket would cost more than the handshake we'd save.
+    """
+    # requests already sends "Accept-Encoding: gzip, deflate" and
+    # iter_content yields decompressed bytes.
+    with _get_session().get(url, timeout=20, stream=True) as resp:
+        resp.raise_for_status()
+        chunks = []
+        size = 0
+        for chunk in resp.iter_content(chunk_size=8192):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= _MAX_HTML_BYTES:
+                break
+        body = b"".join(chunks)[:_MAX_HTML_BYTES]
+        return body.decode(resp.encoding or "utf-8", errors="ignore")
+
+
+# Constant part of every fallback profile, built once; fallbacks just add
+# handle/name/source on top.
+_FALLBACK_FOLLOWERS = 5_000
+_OF_FALLBACK: Dict[str, Any] = {
+    "platform": "OnlyFans",
+    "profile_image_url": None,
+    "followers": _FALLBACK_FOLLOWERS,
+    "likes": None,
+    "posts_count": None,
+    "photos_count": None,
+    "videos_count": None,
+    "avg_views": int(_FALLBACK_FOLLOWERS * 0.3),
+    "engagement_rate": 3.5,
+    "avg_cpm": 20.0,
+    "estimated_subscribers": _FALLBACK_FOLLOWERS,
+    "estimated_monthly_visits": _FALLBACK_FOLLOWERS * 15,
+}
+
+
+def _make_fallback(
+    username: str,
+    raw_source: str,
+    error: Optional[str] = None,
+    profile_name: Optional[str] = None,
+) -> CreatorProfile:
+    """Default values used whenever we can't parse real data."""
+    return CreatorProfile(
+        **_OF_FALLBACK,
+        handle=username,
+        profile_name=profile_name or username,
+        raw_source=raw_source,
+        error=error or None,
+    )
+
+
+def _clean(value: Optional[str]) -> Optional[str]:
+    value = (value or "").strip()
+    return value or None
+
+
+def _split_head(html: str) -> Optional[str]:
+    """Return the document up to and including `</head>`, or None if absent."""
+    match = _RE_HEAD_END.search(html)
+    return html[: match.end()] if match else None
+
+
+def _page_meta_regex(html: str) -> Dict[str, Optional[str]]:
+    """
+    Read og:title, og:image, <title> and the meta description with plain
+    regexes over the page's <head>. All values are None when nothing matched.
+    """
+    head_html = _split_head(html) or html
+    tags: Dict[str, str] = {}
+    for tag in _RE_META.findall(head_html):
+        key = _RE_META_KEY.search(tag)
+        content = _RE_META_CONTENT.search(tag)
+        if key and content:
+            tags.setdefault(key.group(2).lower(), content.group(2))
+    title = _RE_TITLE.search(head_html)
+
+    def get(key: str) -> Optional[str]:
+        value = tags.get(key)
+        return _clean(unescape(value)) if value is not None else None
 
-    return int(num)
+    return {
+        "og_title": get("og:title"),
+        "og_image": get("og:image"),
+        "title": _clean(unescape(title.group(1))) if title else None,
+        "description": get("description"),
+    }
 
 
-def fetch_onlyfans_profile(handle: str) -> Dict[str, Any]:
+def _selectolax_body_text(tree) -> str:
     """
-    Scrape a public OnlyFans profile and estimate:
-      - followers (fans)
-      - avg_views (heuristic from followers)
-      - engagement_rate (heuristic from likes and followers)
-      - avg_cpm (simple assumption)
+    Body text of a selectolax tree. Unlike bs4's get_text(), selectolax's
+    text() includes <script>/<style> contents, so drop those first; otherwise
+    counts in inline JS/JSON state would be scanned as profile stats.
+    """
+    tree.strip_tags(["script", "style", "noscript"])
+    return tree.body.text(separator=" ", strip=True) if tree.body else ""
 
-    Additionally tries to pull:
-      - profile_name
-      - profile_image_url
-      - likes
-      - posts_count
-      - photos_count
-      - videos_count
 
-    Also returns simple ESTIMATES:
-      - estimated_subscribers
-      - estimated_monthly_visits
+def _body_text(html: str) -> str:
+    """Visible text of everything after </head> (the whole page if there's no head)."""
+    head_html = _split_head(html)
+    rest = html[len(head_html):] if head_html is not None else html
+    try:
+        from selectolax.parser import HTMLParser
 
-    Uses public metadata only and NEVER raises on parsing issues.
-    On any failure, falls back to default values and records an 'error'
-    string plus a 'raw_source' flag so the UI can still work.
+        return _selectolax_body_text(HTMLParser(rest))
+    except Exception:
+        from bs4 import BeautifulSoup
+
+        return BeautifulSoup(rest, "html.parser").get_text(separator=" ", strip=True)
+
+
+def _page_meta_selectolax(html: str) -> Tuple[Dict[str, Optional[str]], Callable[[], str]]:
     """
-    username = handle.strip().lstrip("@").strip("/")
-    if not username:
-        followers = 5_000
-        avg_views = int(followers * 0.3)
-        engagement_rate = 3.5
-        avg_cpm = 20.0
-        estimated_subscribers = followers
-        estimated_monthly_visits = followers * 15
-        return {
-            "platform": "OnlyFans",
-            "handle": handle,
-            "profile_name": handle or "Unknown",
-            "profile_image_url": None,
-            "followers": followers,
-            "likes": None,
-            "posts_count": None,
-            "photos_count": None,
-            "videos_count": None,
-            "avg_views": avg_views,
-            "engagement_rate": engagement_rate,
-            "avg_cpm": avg_cpm,
-            "estimated_subscribers": estimated_subscribers,
-            "estimated_monthly_visits": estimated_monthly_visits,
-            "raw_source": "onlyfans_invalid_handle_fallback",
-            "error": "Handle was empty after cleaning.",
-        }
+    Pull the few DOM facts the scraper needs with selectolax (C parser).
+    Returns the meta values plus a callable producing the page's body text.
 
-    url = f"https://onlyfans.com/{username}"
+    Only the <head> is parsed up front; the rest of the document is parsed
+    lazily, the first time the body text is actually needed.
+    """
+    from selectolax.parser import HTMLParser
 
-    # Default values used whenever we can't parse real data
-    def make_fallback(raw_source: str, error: Optional[str] = None) -> Dict[str, Any]:
-        followers = 5_000
-        avg_views = int(followers * 0.3)
-        engagement_rate = 3.5
-        avg_cpm = 20.0
-        estimated_subscribers = followers
-        estimated_monthly_visits = followers * 15
-
-        data = {
-            "platform": "OnlyFans",
-            "handle": username,
-            "profile_name": username,
-            "profile_image_url": None,
-            "followers": followers,
-            "likes": None,
-            "posts_count": None,
-            "photos_count": None,
-            "videos_count": None,
-            "avg_views": avg_views,
-            "engagement_rate": engagement_rate,
-            "avg_cpm": avg_cpm,
-            "estimated_subscribers": estimated_subscribers,
-            "estimated_monthly_visits": estimated_monthly_visits,
-            "raw_source": raw_source,
-        }
-        if error:
-            data["error"] = error
-        return data
-
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0 Safari/537.36"
-        ),
-        "Accept-Language": "en-US,en;q=0.9",
+    head_html = _split_head(html)
+    tree = HTMLParser(head_html if head_html is not None else html)
+
+    def content(selector: str) -> Optional[str]:
+        node = tree.css_first(selector)
+        return _clean(node.attributes.get("content")) if node else None
+
+    title_node = tree.css_first("title")
+    meta = {
+        "og_title": content('meta[property="og:title"]'),
+        "og_image": content('meta[property="og:image"]'),
+        "title": _clean(title_node.text()) if title_node else None,
+        "description": content('meta[name="description"]'),
     }
 
-    try:
-        resp = requests.get(url, headers=headers, timeout=20)
-        resp.raise_for_status()
-    except Exception as e:
-        # Network / HTTP error: fallback so the app never crashes
-        return make_fallback("onlyfans_http_error_fallback", error=str(e))
+    def body_text() -> str:
+        rest = HTMLParser(html[len(head_html):]) if head_html is not None else tree
+        return _selectolax_body_text(rest)
 
-    html = resp.text
-    soup = BeautifulSoup(html, "html.parser")
+    return meta, body_text
 
-    # ---------- Basic identity / image ----------
 
-    profile_name = None
-    profile_image_url = None
+def _page_meta_bs4(html: str) -> Tuple[Dict[str, Optional[str]], Callable[[], str]]:
+    """Same as `_page_meta_selectolax`, using BeautifulSoup (fallback only)."""
+    from bs4 import BeautifulSoup
 
-    og_title = soup.find("meta", property="og:title")
-    if og_title and og_title.get("content"):
-        profile_name = og_title["content"].strip()
+    head_html = _split_head(html)
+    soup = BeautifulSoup(head_html if head_html is not None else html, "html.parser")
 
-    og_image = soup.find("meta", property="og:image")
-    if og_image and og_image.get("content"):
-        profile_image_url = og_image["content"].strip()
+    def content(tag) -> Optional[str]:
+        return _clean(tag.get("content")) if tag else None
 
-    if not profile_name and soup.title and soup.title.string:
-        profile_name = soup.title.string.strip()
+    meta = {
+        "og_title": content(soup.find("meta", property="og:title")),
+        "og_image": content(soup.find("meta", property="og:image")),
+        "title": _clean(soup.title.string) if soup.title else None,
+        "description": content(soup.find("meta", attrs={"name": "description"})),
+    }
+
+    def body_text() -> str:
+        rest = BeautifulSoup(html[len(head_html):], "html.parser") if head_html is not None else soup
+        return rest.get_text(separator=" ", strip=True)
+
+    return meta, body_text
+
+
+def _parse_of_html(html: str, username: str) -> CreatorProfile:
+    """
+    Build the profile from a fetched OnlyFans page. Pure: no network,
+    no caching, never raises on missing data.
+    """
+    meta = _page_meta_regex(html)
+    # The description carries the stats, so a regex miss there (unusual
+    # markup, or a page without one) is settled by a real parse of the <head>.
+    # og:title or <title> matching says nothing about whether it worked.
+    if meta["description"]:
+        body_text = partial(_body_text, html)
+    else:
+        try:
+            meta, body_text = _page_meta_selectolax(html)
+        except Exception:
+            # Malformed markup the C parser chokes on: fall back to the slower,
+            # more forgiving pure-Python parser.
+            meta, body_text = _page_meta_bs4(html)
+
+    # ---------- Basic identity / image ----------
+
+    profile_name = meta["og_title"] or meta["title"]
+    profile_image_url = meta["og_image"]
 
     # ---------- Numeric stats ----------
 
-    followers = None
-    likes = None
-    posts_count = None
-    photos_count = None
-    videos_count = None
+    stats: Dict[str, Optional[int]] = dict.fromkeys(
+        ("followers", "likes", "posts_count", "photos_count", "videos_count")
+    )
 
     # 1) Try meta description (common older pattern)
-    meta_desc_tag = soup.find("meta", attrs={"name": "description"})
-    if meta_desc_tag and meta_desc_tag.get("content"):
-        desc = meta_desc_tag["content"]
-
-        likes_match = re.search(r"(\d[\d.,]*\s*[kKmM]?)\s+[Ll]ikes", desc)
-        fans_match = re.search(r"(\d[\d.,]*\s*[kKmM]?)\s+(fans|Fans)", desc)
-        posts_match = re.search(r"(\d[\d.,]*\s*[kKmM]?)\s+[Pp]osts?", desc)
-        photos_match = re.search(r"(\d[\d.,]*\s*[kKmM]?)\s+[Pp]hotos?", desc)
-        videos_match = re.search(r"(\d[\d.,]*\s*[kKmM]?)\s+[Vv]ideos?", desc)
-
-        if likes_match:
-            likes = _parse_human_number(likes_match.group(1))
-        if fans_match:
-            followers = _parse_human_number(fans_match.group(1))
-        if posts_match:
-            posts_count = _parse_human_number(posts_match.group(1))
-        if photos_match:
-            photos_count = _parse_human_number(photos_match.group(1))
-        if videos_match:
-            videos_count = _parse_human_number(videos_match.group(1))
-
-    # 2) Search in full page text for any remaining stats
-    text = soup.get_text(separator=" ", strip=True)
-
-    if followers is None:
-        fans_match = re.search(r"(\d[\d.,]*\s*[kKmM]?)\s+(fans|Followers?)", text)
-        if fans_match:
-            followers = _parse_human_number(fans_match.group(1))
-
-    if likes is None:
-        likes_match = re.search(r"(\d[\d.,]*\s*[kKmM]?)\s+[Ll]ikes", text)
-        if likes_match:
-            likes = _parse_human_number(likes_match.group(1))
-
-    if posts_count is None:
-        posts_match = re.search(r"(\d[\d.,]*\s*[kKmM]?)\s+[Pp]osts?", text)
-        if posts_match:
-            posts_count = _parse_human_number(posts_match.group(1))
-
-    if photos_count is None:
-        photos_match = re.search(r"(\d[\d.,]*\s*[kKmM]?)\s+[Pp]hotos?", text)
-        if photos_match:
-            photos_count = _parse_human_number(photos_match.group(1))
-
-    if videos_count is None:
-        videos_match = re.search(r"(\d[\d.,]*\s*[kKmM]?)\s+[Vv]ideos?", text)
-        if videos_match:
-            videos_count = _parse_human_number(videos_match.group(1))
+    if meta["description"]:
+        _scan_stats(meta["description"], stats)
+
+    # 2) Search the page text for any remaining stats: the <title> first (the
+    #    body text below starts after </head>, so it doesn't include it), then
+    #    the body. Extracting the body text walks the whole DOM, so skip it
+    #    when the description and title had everything.
+    if meta["title"] and None in stats.values():
+        _scan_stats(meta["title"], stats)
+    if None in stats.values():
+        _scan_stats(body_text(), stats)
+
+    followers = stats["followers"]
+    likes = stats["likes"]
+    posts_count = stats["posts_count"]
+    photos_count = stats["photos_count"]
+    videos_count = stats["videos_count"]
 
     # 3) If absolutely nothing numeric was found, use fallback defaults
     if followers is None and likes is None and posts_count is None:
-        fb = make_fallback("onlyfans_fallback_no_numbers_found")
-        fb["profile_name"] = profile_name or username
-        fb["profile_image_url"] = profile_image_url
-        return fb
+        fb = _make_fallback(
+            username, "onlyfans_fallback_no_numbers_found", profile_name=profile_name
+        )
+        return replace(fb, profile_image_url=profile_image_url)
 
     # 4) Derive core metrics
 
@@ -235,26 +408,88 @@ def fetch_onlyfans_profile(handle: str) -> Dict[str, Any]:
     estimated_subscribers = followers  # "fans" on OF ~= subscribers
     estimated_monthly_visits = followers * 15  # assumption-based
 
-    return {
-        "platform": "OnlyFans",
-        "handle": username,
-        "profile_name": profile_name or username,
-        "profile_image_url": profile_image_url,
-        "followers": followers,
-        "likes": likes,
-        "posts_count": posts_count,
-        "photos_count": photos_count,
-        "videos_count": videos_count,
-        "avg_views": avg_views,
-        "engagement_rate": engagement_rate,
-        "avg_cpm": avg_cpm,
-        "estimated_subscribers": estimated_subscribers,
-        "estimated_monthly_visits": estimated_monthly_visits,
-        "raw_source": "onlyfans_meta_or_text",
-    }
+    return CreatorProfile(
+        platform="OnlyFans",
+        handle=username,
+        profile_name=profile_name or username,
+        profile_image_url=profile_image_url,
+        followers=followers,
+        likes=likes,
+        posts_count=posts_count,
+        photos_count=photos_count,
+        videos_count=videos_count,
+        avg_views=avg_views,
+        engagement_rate=engagement_rate,
+        avg_cpm=avg_cpm,
+        estimated_subscribers=estimated_subscribers,
+        estimated_monthly_visits=estimated_monthly_visits,
+        raw_source="onlyfans_meta_or_text",
+    )
+
+
+def fetch_onlyfans_profile(handle: str) -> CreatorProfile:
+    """
+    Scrape a public OnlyFans profile and estimate:
+      - followers (fans)
+      - avg_views (heuristic from followers)
+      - engagement_rate (heuristic from likes and followers)
+      - avg_cpm (simple assumption)
+
+    Additionally tries to pull:
+      - profile_name
+      - profile_image_url
+      - likes
+      - posts_count
+      - photos_count
+      - videos_count
+
+    Also returns simple ESTIMATES:
+      - estimated_subscribers
+      - estimated_monthly_visits
+
+    Uses public metadata only and NEVER raises on parsing issues.
+    On any failure, falls back to default values and records an 'error'
+    string plus a 'raw_source' flag so the UI can still work.
+    """
+    username = handle.strip().lstrip("@").strip("/")
+    if not username:
+        return _make_fallback(
+            handle,
+            "onlyfans_invalid_handle_fallback",
+            error="Handle was empty after cleaning.",
+            profile_name=handle or "Unknown",
+        )
+
+    cached = _cache_get(username)
+    if cached is not None:
+        return cached
+
+    url = f"https://onlyfans.com/{username}"
+
+    try:
+        html = _fetch_html(url)
+    except Exception as e:
+        # Network / HTTP error: fallback so the app never crashes
+        return _make_fallback(username, "onlyfans_http_error_fallback", error=str(e))
+
+    profile = _parse_of_html(html, username)
+    _cache_put(username, profile)
+    return profile
+
+
+def fetch_many_onlyfans_profiles(handles: List[str], max_concurrency: int = 5) -> List[CreatorProfile]:
+    """
+    Fetch several OnlyFans profiles concurrently, at most `max_concurrency`
+    requests in flight. Results come back in the same order as `handles`;
+    like `fetch_onlyfans_profile`, failures yield fallback profiles, never raise.
+    """
+    if not handles:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(handles)))) as pool:
+        return list(pool.map(fetch_onlyfans_profile, handles))
 
 
-def fetch_creator_profile_from_web(handle: str, platform: str) -> Dict[str, Any]:
+def fetch_creator_profile_from_web(handle: str, platform: str) -> CreatorProfile:
     """
     Dispatcher for web lookups by platform.
     """
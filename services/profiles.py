@@ -0,0 +1,55 @@
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Optional
+
+# Count fields that get a preformatted "<field>_fmt" display string.
+COUNT_FIELDS = ("followers", "likes", "posts_count", "photos_count", "videos_count")
+
+
+@dataclass(frozen=True, slots=True)
+class CreatorProfile:
+    """
+    A creator's public stats, either scraped from the web or typed in by hand.
+    Fixed schema with slots: smaller than a dict and faster attribute reads.
+    Immutable, so caches can hand out the same instance without copying.
+    Use `as_dict` at JSON/debug boundaries.
+    """
+    platform: str = "Unknown"
+    handle: str = ""
+    profile_name: str = ""
+    profile_image_url: Optional[str] = None
+    followers: Optional[int] = None
+    likes: Optional[int] = None
+    posts_count: Optional[int] = None
+    photos_count: Optional[int] = None
+    videos_count: Optional[int] = None
+    avg_views: Optional[int] = None
+    engagement_rate: Optional[float] = None
+    avg_cpm: Optional[float] = None
+    estimated_subscribers: Optional[int] = None
+    estimated_monthly_visits: Optional[int] = None
+    raw_source: Optional[str] = None
+    error: Optional[str] = None
+
+    # Thousands-separated display strings, filled in by __post_init__.
+    followers_fmt: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    likes_fmt: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    posts_count_fmt: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    photos_count_fmt: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    videos_count_fmt: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Format the counts once per profile so the UI doesn't redo it every rerun.
+        for name in COUNT_FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                object.__setattr__(self, f"{name}_fmt", f"{value:,}")
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Plain dict of the profile's data, as the scraper used to return it:
+        no derived *_fmt strings, and no "error" key unless there was one.
+        """
+        data = {f.name: getattr(self, f.name) for f in fields(self) if f.init}
+        if data["error"] is None:
+            del data["error"]
+        return data